@@ -1,4 +1,8 @@
-from typing import Iterable
+from itertools import chain as _chain, filterfalse, starmap, takewhile, tee
+from typing import Iterable, Optional
+
+# Movement (dx, dy) for each swipe direction
+_DIR = {"left": (-1, 0), "right": (1, 0), "up": (0, -1), "down": (0, 1)}
 
 class StringGrid:
     """
@@ -7,6 +11,8 @@ class StringGrid:
     
     Attributes:
     - grid (str): The grid data in string form, with rows separated by newlines.
+      This single flat string is the only copy of the cells; coordinates are
+      mapped onto it arithmetically instead of splitting it into rows.
     - width (int): The number of columns in the grid.
     - height (int): The number of rows in the grid.
     """
@@ -16,11 +22,24 @@ class StringGrid:
         Initializes the grid object.
         
         Parameters:
-        - grid (str): The grid data in string format.
+        - grid (str): The grid data in string format, with rows separated by any line break
+          that str.splitlines() recognizes. Every row must have the same width.
+        
+        Raises:
+        - ValueError: If the rows do not all have the same width.
         """
+        # Split on every line break splitlines() accepts ("\r\n", "\r", "\v", "\u2028", ...)
+        # and rejoin with one "\n", which also drops a trailing line break
+        grid = "\n".join(grid.splitlines())
         self.grid = grid
-        self.width = len(self.grid.splitlines()[0])  # Width is determined by the first row
-        self.height = len(self.grid.splitlines())    # Height is the number of rows
+        newline = grid.find("\n")
+        self.width = newline if newline >= 0 else len(grid)  # Width is determined by the first row
+        self._stride = self.width + 1  # Characters per row, including its newline
+        self.height = grid.count("\n") + 1 if grid else 0  # Height is the number of rows
+        # Coordinates are mapped arithmetically, so every row must end exactly one stride after the last
+        if grid and (len(grid) + 1 != self.height * self._stride
+                     or grid[self.width::self._stride] != "\n" * (self.height - 1)):
+            raise ValueError("All rows of a grid must have the same width")
     
     def grab(self, x: int, y: int) -> str:
         """
@@ -32,8 +51,127 @@ class StringGrid:
         
         Returns:
         - str: The character at the specified location in the grid.
+        
+        Raises:
+        - IndexError: If the coordinates are outside the grid.
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError("Grid coordinates out of range")
+        return self.grid[self._offset(x, y)]
+    
+    def _offset(self, x: int, y: int) -> int:
+        """
+        Maps (x, y) coordinates onto an index into the flat grid string.
+        
+        Parameters:
+        - x (int): The column index.
+        - y (int): The row index.
+        
+        Returns:
+        - int: The index of that cell in the grid string.
+        """
+        return y * self._stride + x
+    
+    def to_string(self) -> str:
+        """
+        Returns the grid as a string, with rows separated by newlines.
+        
+        Returns:
+        - str: The grid data in string format.
         """
-        return self.grid.splitlines()[y][x]
+        return self.grid
+
+class GridBatch:
+    """
+    Class holding many grids of the same size in one flat string, so that searches
+    across all of them scan a single buffer instead of many separate grid objects.
+    
+    Attributes:
+    - cells (str): Every grid's data, one after another, with all rows separated by newlines.
+    - count (int): The number of grids in the batch.
+    - width (int): The number of columns in each grid.
+    - height (int): The number of rows in each grid.
+    """
+    
+    def __init__(self, grids: list[str]):
+        """
+        Initializes the batch from grid strings.
+        
+        Parameters:
+        - grids (list): The grids in string format. They must all have the same dimensions.
+        
+        Raises:
+        - ValueError: If a grid is empty, has rows of different widths, or the grids differ in size.
+        """
+        parsed = [StringGrid(grid) for grid in grids]
+        self.count = len(parsed)
+        self.width = parsed[0].width if parsed else 0
+        self.height = parsed[0].height if parsed else 0
+        if any(g.width != self.width or g.height != self.height for g in parsed):
+            raise ValueError("All grids in a batch must have the same dimensions")
+        if parsed and self.height == 0:
+            raise ValueError("Grids in a batch must have at least one row")  # Each grid needs its own slice of cells
+        self.cells = "\n".join(g.grid for g in parsed)  # The newline between grids ends each last row
+        self._stride = self.width + 1  # Characters per row, including its newline
+        self._size = self.height * self._stride  # Characters per grid, including row separators
+    
+    def grid(self, index: int) -> StringGrid:
+        """
+        Returns one grid of the batch as its own grid object.
+        
+        Parameters:
+        - index (int): The position of the grid in the batch.
+        
+        Returns:
+        - StringGrid: The grid at that position.
+        
+        Raises:
+        - IndexError: If the index is outside the batch.
+        """
+        if not 0 <= index < self.count:
+            raise IndexError("Grid index out of range")
+        start = index * self._size
+        return StringGrid(self.cells[start:start + self._size - 1])
+    
+    def find_first(self, item: str) -> list:
+        """
+        Finds the coordinates of the first occurrence of a specific item (character)
+        in each grid of the batch, scanning rows top to bottom like find_grid_item.
+        
+        Parameters:
+        - item (str): The character to search for.
+        
+        Returns:
+        - list: One entry per grid: the (x, y) coordinates of the item's first occurrence
+          in that grid, or None for grids without it.
+        """
+        found = []
+        for n in range(self.count):
+            start = n * self._size  # Search only this grid's slice, excluding the separator after it
+            found.append(_find_cell(self.cells, item, self._stride, start, start + self._size - 1))
+        return found
+
+def _find_cell(cells: str, item: str, stride: int, start: int = 0, end: Optional[int] = None):
+    """
+    Finds the first cell equal to item in the slice cells[start:end] of a flat grid string.
+    
+    Parameters:
+    - cells (str): The flat grid string, with rows separated by newlines.
+    - item (str): The character to search for.
+    - stride (int): The number of characters per row, including its newline.
+    - start (int): The index where the grid begins in cells.
+    - end (int): The index where the grid ends in cells (default is the end of cells).
+    
+    Returns:
+    - tuple: The (x, y) coordinates of the found item relative to start, or None if not found.
+    """
+    if len(item) != 1 or item == "\n":
+        return None  # Only a single character other than the row separator can be a cell of the grid
+    index = cells.find(item, start, end)  # Scan the whole grid slice in one pass
+    if index < 0:
+        return None  # Return None if the item is not found
+    y, x = divmod(index - start, stride)  # Each row is followed by a newline
+    return (x, y)  # Return the coordinates of the found item
 
 def find_grid_item(x: StringGrid, item: str):
     """
@@ -46,11 +184,7 @@ def find_grid_item(x: StringGrid, item: str):
     Returns:
     - tuple: The (x, y) coordinates of the found item, or None if not found.
     """
-    for y in range(x.height):
-        for x2 in range(x.width):
-            if x.grab(x2, y) == item:
-                return (x2, y)  # Return the coordinates of the found item
-    return None  # Return None if the item is not found
+    return _find_cell(x.grid, item, x._stride)
 
 def bounds(x: StringGrid) -> str:
     """
@@ -78,59 +212,44 @@ def swipe(x: StringGrid, character: str, direction: str, blankness: str = "."):
     Returns:
     - str: The updated grid as a string after the move, or "OOB" if the move is out of bounds.
     """
-    # Convert the grid to a list of lists for easier manipulation (strings are immutable)
-    rx = [list(row) for row in x.grid.splitlines()]
-    
-    # Convert the direction to lowercase to handle case insensitivity
-    direction = direction.lower()
+    # Look up the change in x (dx) and y (dy) for the direction, ignoring case
+    dx, dy = _DIR[direction.lower()]
     
     # Find the current position of the character in the grid
     item = find_grid_item(x, character)
     
-    # Extract the width and height from the grid's bounds
-    w, h = map(int, bounds(x).split("x"))  # Convert to integers for comparison
-    
-    # Define the movement directions for left, right, up, down
-    directs = {"left": -1, "right": 1, "up": -1, "down": 1}
-    
-    # Initialize the change in x (dx) and y (dy) coordinates
-    dx = dy = 0
-    
-    # Assign dx or dy based on the direction of movement
-    if direction in ["left", "right"]:
-        dx = directs[direction]
-    else:
-        dy = directs[direction]
+    # Read the width and height straight from the grid
+    w, h = x.width, x.height
     
     # Calculate the new position after the move
-    new_x = item[0] + dy
-    new_y = item[1] + dx
+    new_x = item[0] + dx
+    new_y = item[1] + dy
     
     # Check if the new position is out of bounds
-    if new_x < 0 or new_x >= h or new_y < 0 or new_y >= w:
+    if new_x < 0 or new_x >= w or new_y < 0 or new_y >= h:
         return "OOB"  # Return "OOB" if the position is out of bounds
     
-    # Move the character to the new position
-    rx[new_x][new_y] = character
+    # Map both positions onto the flat grid string (each row is followed by a newline)
+    old = x._offset(item[0], item[1])
+    new = x._offset(new_x, new_y)
     
-    # Replace the old position with the blank character
-    rx[item[0]][item[1]] = blankness
-    
-    # Convert the list of lists back to a string grid and return it
-    return "\n".join("".join(row) for row in rx)
+    # Splice the blank into the old position and the character into the new one
+    cells = x.grid
+    if old < new:
+        return cells[:old] + blankness + cells[old + 1:new] + character + cells[new + 1:]
+    return cells[:new] + character + cells[new + 1:old] + blankness + cells[old + 1:]
 
 def chain(i: Iterable):
     """
-    Chains the elements of an iterable, yielding each item in turn.
+    Returns an iterator over the elements of an iterable, one item at a time.
     
     Parameters:
     - i (Iterable): The iterable to iterate over.
     
-    Yields:
-    - The next item in the iterable.
+    Returns:
+    - Iterator: An iterator over the items in the iterable.
     """
-    for item in i:
-        yield item
+    return iter(i)
 
 def joint(x: Iterable, x2: Iterable) -> Iterable:
     """
@@ -142,16 +261,16 @@ def joint(x: Iterable, x2: Iterable) -> Iterable:
     
     Returns:
     - Iterable: The combined iterable containing all elements of both x and x2.
+      Strings, lists and tuples keep their type; other iterables are chained lazily.
     """
-    i = list(x) + list(x2)  # Concatenate the two iterables
     if isinstance(x, str):
-        return ''.join(i)  # If the first iterable is a string, join the result as a string
+        return x + (x2 if isinstance(x2, str) else ''.join(x2))  # If the first iterable is a string, return a string
     elif isinstance(x, list):
-        return i  # If the first iterable is a list, return a list
+        return x + (x2 if isinstance(x2, list) else list(x2))  # If the first iterable is a list, return a list
     elif isinstance(x, tuple):
-        return tuple(i)  # If the first iterable is a tuple, return a tuple
+        return x + tuple(x2)  # If the first iterable is a tuple, return a tuple
     else:
-        return i  # For other types, return the combined iterable
+        return _chain(x, x2)  # For other types, chain them without materializing either
 
 def select(x: Iterable, matches: list):
     """
@@ -162,19 +281,16 @@ def select(x: Iterable, matches: list):
     - matches (list): A list of conditions (as integers) to match against the iterable.
     
     Returns:
-    - str: A new iterable with only the items that match the conditions.
+    - Iterable: A new iterable of the same type as x (str, list or tuple) with only
+      the items that match the conditions. Other types give back a list.
     """
-    p = ""
     if len(matches) == len(x):
-        for index, item in enumerate(matches):
-            matches[index] = int(item)
-        for index, item in enumerate(x):
-            if matches[index] >= 1:
-                p += str(item)
-        p = type(x)(p)
-        if type(p).__name__ != "str":
-            for index, item in enumerate(x[:len(p)]):
-                p[index] = type(x[index])(item)
+        mask = [int(m) >= 1 for m in matches]  # Coerce each condition once, without touching matches
+        if isinstance(x, str):
+            return "".join(c for c, m in zip(x, mask) if m)
+        p = [v for v, m in zip(x, mask) if m]
+        if isinstance(x, tuple):
+            return tuple(p)
         return p
     else:
         return IndexError("Length of matches not length of x")
@@ -190,10 +306,7 @@ def listmap(f, args: list[tuple]):
     Returns:
     - list: A list of the results of applying f to each tuple in args.
     """
-    r = []
-    for item in args:
-        r.append(f(*item))  # Apply function to each tuple of arguments
-    return r
+    return list(starmap(f, args))  # Same as calling f(*item) for each item, in order
 
 def zip_iterables(iter1: Iterable, iter2: Iterable) -> Iterable:
     """
@@ -206,9 +319,7 @@ def zip_iterables(iter1: Iterable, iter2: Iterable) -> Iterable:
     Yields:
     - tuple: A tuple of corresponding elements from both iterables.
     """
-    min_len = min(len(iter1), len(iter2))
-    for i in range(min_len):
-        yield (iter1[i], iter2[i])
+    yield from zip(iter1, iter2)  # Stops at the end of the shorter iterable
 
 def unique(iterable: Iterable) -> Iterable:
     """
@@ -226,6 +337,19 @@ def unique(iterable: Iterable) -> Iterable:
             yield item
             seen.add(item)
 
+def unique_list(iterable: Iterable) -> list:
+    """
+    Returns the unique elements of an iterable as a list, keeping their first-seen order.
+    Unlike unique, this reads the whole iterable at once, and its items must be hashable.
+    
+    Parameters:
+    - iterable (Iterable): The iterable to filter for unique items.
+    
+    Returns:
+    - list: The unique items in the iterable.
+    """
+    return list(dict.fromkeys(iterable))  # dict keys keep insertion order
+
 def partition(iterable: Iterable, condition) -> tuple:
     """
     Partitions the iterable into two parts based on a condition.
@@ -239,50 +363,59 @@ def partition(iterable: Iterable, condition) -> tuple:
              and one with items that do not.
     """
     true_part, false_part = [], []
+    true_append, false_append = true_part.append, false_part.append  # Bind once, outside the loop
     for item in iterable:
-        if condition(item):
-            true_part.append(item)
-        else:
-            false_part.append(item)
+        (true_append if condition(item) else false_append)(item)
     return true_part, false_part
 
+def partition_lazy(iterable: Iterable, condition) -> tuple:
+    """
+    Partitions the iterable into two lazy iterators based on a condition.
+    Unlike partition, nothing is read until the iterators are consumed, and
+    the condition is called once per item for each iterator.
+    
+    Parameters:
+    - iterable (Iterable): The iterable to partition.
+    - condition (function): A function that returns a boolean value.
+    
+    Returns:
+    - tuple: A tuple containing two iterators: one over items that satisfy the condition,
+             and one over items that do not.
+    """
+    t1, t2 = tee(iterable)
+    return filter(condition, t1), filterfalse(condition, t2)
+
 def take_while(iterable: Iterable, condition) -> Iterable:
     """
-    Yields elements from the iterable as long as they satisfy the condition.
+    Returns an iterator over elements of the iterable for as long as they satisfy the condition.
     
     Parameters:
     - iterable (Iterable): The iterable to iterate over.
     - condition (function): A function that returns a boolean value.
     
-    Yields:
-    - The elements of the iterable that satisfy the condition.
+    Returns:
+    - Iterator: The elements of the iterable that satisfy the condition, stopping at the first that does not.
     """
-    for item in iterable:
-        if not condition(item):
-            break  # Stop yielding once the condition is no longer satisfied
-        yield item
+    return takewhile(condition, iterable)
 
 
 def make_grid(length:int,width:int,character:str):
     """Makes you a grid made of a character based on the dimensions."""
-    return "\n".join([character*width]*length)
+    row = character * width + "\n"
+    return (row * length)[:-1]  # Repeat the row once in C, then drop the trailing newline
 
 def look(x:StringGrid,character:str,lookwhere:str):
     """Uses built-in swipe to look in directions."""
     ch = list(find_grid_item(x,character))
 
-    for letter in lookwhere:
-        if letter == "U":
-            ch[1] -= 1
-        elif letter == "D":
-            ch[1] += 1
-        elif letter == "L":
-            ch[0] -= 1
-        elif letter == "R":
-            ch[0] += 1
-        else:
-            raise ValueError("USE UDLR!")
-    if ch[0] < 0 or ch[0] > x.width or ch[1] < 0 or ch[1] > x.height:
+    # The path only matters through its net movement, so count each letter in C
+    up, down = lookwhere.count("U"), lookwhere.count("D")
+    left, right = lookwhere.count("L"), lookwhere.count("R")
+    if up + down + left + right != len(lookwhere):
+        raise ValueError("USE UDLR!")
+    ch[0] += right - left
+    ch[1] += down - up
+    if ch[0] < 0 or ch[0] >= x.width or ch[1] < 0 or ch[1] >= x.height:
         return "OOB"
     else:
         return x.grab(ch[0],ch[1])